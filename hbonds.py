@@ -1,5 +1,84 @@
 import numpy as np
-import re
+import concurrent.futures
+import functools
+import weakref
+from itertools import islice
+
+# per-topology cache of sidechain/water atom index sets
+_top_cache = weakref.WeakKeyDictionary()
+
+# per-topology cache of hbond strings for every atom
+_string_cache = weakref.WeakKeyDictionary()
+
+# numba is optional, pure numpy is used when it is not installed
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _map_letter_numpy(wrid_letter, wrid_whole, wrid_red):
+    '''Map tracked residue indices to reduced indices with a boolean mask.
+
+    Returns the mapping and the first frame with a duplicate residue
+    index, or -1 if there is none.
+    '''
+    # compare all frames against the tracked residue index at once
+    eq = wrid_whole == wrid_letter[:, None]
+    counts = eq.sum(axis=1)
+    dup = -1
+    if np.any(counts > 1):
+        dup = int(np.argmax(counts > 1))
+
+    # index of match in each frame, 0 for frames without match
+    res_idx = eq.argmax(axis=1)
+    has_match = eq.any(axis=1)
+    return np.where(has_match, wrid_red[res_idx], 0), dup
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _map_letter(wrid_letter, wrid_whole, wrid_red):
+        '''Map tracked residue indices to reduced indices, frames in parallel.
+
+        Returns the mapping and the first frame with a duplicate residue
+        index, or -1 if there is none.
+        '''
+        n_frames = wrid_letter.shape[0]
+        out = np.zeros(n_frames, dtype=np.int64)
+
+        # scalars written in the prange body are privatized per thread, so
+        # duplicates are flagged per frame and collected after the loop
+        dup_flags = np.zeros(n_frames, dtype=np.bool_)
+        for i in prange(n_frames):
+            target = wrid_letter[i]
+            n_hits = 0
+            for j in range(wrid_whole.shape[1]):
+                if wrid_whole[i, j] == target:
+                    if n_hits == 0:
+                        out[i] = wrid_red[j]
+                    n_hits += 1
+            if n_hits > 1:
+                dup_flags[i] = True
+
+        dup = -1
+        for i in range(n_frames):
+            if dup_flags[i]:
+                dup = i
+                break
+        return out, dup
+
+    @njit(cache=True)
+    def _fill_hbond_matrix(mat, di, ai):
+        '''Accumulate hbond counts into mat at the given index pairs.'''
+        for k in range(di.shape[0]):
+            mat[di[k], ai[k]] += 1
+else:
+    _map_letter = _map_letter_numpy
+
+    def _fill_hbond_matrix(mat, di, ai):
+        '''Accumulate hbond counts into mat at the given index pairs.'''
+        np.add.at(mat, (di, ai), 1)
 
 
 def map_w_to_index(t, t_red, idx_file, atom_mapping, verbose=False):
@@ -39,38 +118,99 @@ def map_w_to_index(t, t_red, idx_file, atom_mapping, verbose=False):
     # list of letter codes from mapping
     letter_codes = [x for x in atom_mapping.keys()]
 
+    # atom index -> residue index lookup, built once for the whole topology
+    atom2res = np.fromiter((a.residue.index for a in t.top.atoms), dtype=np.int64, count=t.n_atoms)
+
     # assign water residue indices of whole trj to letter codes
     wrid_letters = {}
     for wl in letter_codes:
-        wrid_letters[wl] = np.array([t.top.atom(x).residue.index for x in atom_mapping[wl]])
+        wrid_letters[wl] = atom2res[atom_mapping[wl]]
 
     # map water residue indices of reduced trj to letter codes
+    wrid_red = np.asarray(wrid_red, dtype=np.int64)
     mapping_res = {}
     for wl in letter_codes:
-        mapping_res[wl] = np.zeros(t.n_frames, dtype=int)
-        for i_frame in range(t.n_frames):
-            wrid = wrid_letters[wl][i_frame]
-            if wrid in wrid_whole[i_frame]:
-                res_idx, = np.where(wrid_whole[i_frame] == wrid)
-                if len(res_idx) == 1:
-                    res_idx = res_idx[0]
-                else:
-                    raise ValueError(f'More than one index {wrid} in frame {i_frame}.')
-
-                mapping_res[wl][i_frame] = wrid_red[res_idx]
+        mapping_res[wl], dup = _map_letter(wrid_letters[wl], wrid_whole, wrid_red)
+        if dup != -1:
+            raise ValueError(f'More than one index {wrid_letters[wl][dup]} in frame {dup}.')
+
+    return mapping_res
+
+
+def _top_selection_sets(t):
+    '''
+    Get sidechain and water atom index sets of a trajectory topology.
+
+    The selections are cached per topology object, so they only run once per
+    trajectory.
+
+    Parameters
+    ----------
+    t : md.Trajectory
+        Trajectory whose topology is selected on.
+
+    Returns
+    -------
+    sidechain_ids : frozenset
+        Atom indices of sidechain atoms.
+    water_ids : frozenset
+        Atom indices of water atoms.
+    '''
+    top = t.top
+    try:
+        return _top_cache[top]
+    except KeyError:
+        sidechain_ids = frozenset(top.select('is_sidechain').tolist())
+        water_ids = frozenset(top.select('is_water').tolist())
+        _top_cache[top] = (sidechain_ids, water_ids)
+        return _top_cache[top]
+
+
+def _atom_strings(t):
+    '''
+    Get hbond strings for every atom of a trajectory topology.
+
+    The strings only depend on the topology, so they are tabulated once per
+    trajectory and cached per topology object.
+
+    Parameters
+    ----------
+    t : md.Trajectory
+        Trajectory whose atoms are converted.
 
+    Returns
+    -------
+    strings : list of str
+        Hbond string for every atom index. Water letter codes are not applied
+        here, as they change per frame.
+    '''
+    top = t.top
+    try:
+        return _string_cache[top]
+    except KeyError:
+        sidechain_ids, water_ids = _top_selection_sets(t)
+
+        strings = [None] * top.n_atoms
+        for a in top.atoms:
+            if a.index in water_ids:
+                tag = 'w'
+            elif a.index in sidechain_ids:
+                tag = 's'
             else:
-                mapping_res[wl][i_frame] = 0
+                tag = 'b'
+            strings[a.index] = a.residue.name + str(a.residue.resSeq) + tag + f'-{a.element.symbol}'
 
-    return mapping_res
+        _string_cache[top] = strings
+        return strings
 
 
 def convert_hb_atom(idx,
                     t,
                     sidechain_ids=None,
                     water_ids=None,
-                    wlet_mapping=None,
-                    i_frame=None):
+                    res2letter=None,
+                    i_frame=None,
+                    cache=None):
     '''
     Convert atom index to hbond string.
 
@@ -83,16 +223,19 @@ def convert_hb_atom(idx,
         Atom index of hydrogen bond donor or acceptor.
     t : md.Trajectory
         Trajectory in which the atom index can be found.
-    sidechain_ids : np.ndarray or None
+    sidechain_ids : set or np.ndarray or None
         Atom indices of sidechain atoms in trajectory. If None, will be selected
         from t.
-    water_ids : np.ndarray or None
+    water_ids : set or np.ndarray or None
         Atom indices of water atoms in trajectory. If None, will be selected
         from t.
-    wlet_mapping : dict or None
-        Mapping of water residue indices to letter codes.
+    res2letter : dict or None
+        Mapping of water residue indices to letter codes for the current frame.
     i_frame : int or None
         Number of current frame. Needed when wlet mapping is enabled.
+    cache : dict or None
+        Cache of already converted atoms, keyed by idx or (idx, i_frame) when
+        wlet mapping is enabled. Filled by this function.
 
     Returns
     -------
@@ -103,26 +246,36 @@ def convert_hb_atom(idx,
     if type(idx) == str:
         return idx
 
-    # load water and sidechain atom indices
-    if not type(sidechain_ids) == np.ndarray:
-        sidechain_ids = t.top.select('is_sidechain')
-    if not type(water_ids) == np.ndarray:
-        water_ids = t.top.select('is_water')
-
-    a = t.top.atom(idx)
-    if idx in water_ids:
-        if wlet_mapping:
+    # look up atoms converted in earlier calls
+    if cache is not None:
+        key = (idx, i_frame) if res2letter else idx
+        if key in cache:
+            return cache[key]
+
+    if sidechain_ids is None and water_ids is None:
+        # topology-only strings are tabulated once per trajectory
+        s = _atom_strings(t)[idx]
+        if res2letter:
+            s = res2letter.get(t.top.atom(idx).residue.index, s)
+    else:
+        # load water and sidechain atom indices
+        if sidechain_ids is None:
+            sidechain_ids = _top_selection_sets(t)[0]
+        if water_ids is None:
+            water_ids = _top_selection_sets(t)[1]
+
+        a = t.top.atom(idx)
+        if idx in water_ids:
             s = a.residue.name + str(a.residue.resSeq) + 'w' + f'-{a.element.symbol}'
-            for wl in wlet_mapping:
-                w_id = wlet_mapping[wl].astype('int')[i_frame]
-                if w_id == a.residue.index and w_id != 0:
-                    s = wl
+            if res2letter:
+                s = res2letter.get(a.residue.index, s)
+        elif idx in sidechain_ids:
+            s = a.residue.name + str(a.residue.resSeq) + 's' + f'-{a.element.symbol}'
         else:
-            s = a.residue.name + str(a.residue.resSeq) + 'w' + f'-{a.element.symbol}'
-    elif idx in sidechain_ids:
-        s = a.residue.name + str(a.residue.resSeq) + 's' + f'-{a.element.symbol}'
-    else:
-        s = a.residue.name + str(a.residue.resSeq) + 'b' + f'-{a.element.symbol}'
+            s = a.residue.name + str(a.residue.resSeq) + 'b' + f'-{a.element.symbol}'
+
+    if cache is not None:
+        cache[key] = s
     return s
 
 
@@ -146,28 +299,39 @@ def hbond_to_string(hbonds,
     '''
     hbonds_new = []
 
-    # load sidechain and water atom indices
-    sidechain_ids = t.top.select('is_sidechain')
-    water_ids = t.top.select('is_water')
+    # cache of converted atoms, so every atom is only formatted once
+    cache = {}
+
+    # coerce letter mappings to integer arrays once, without copying if already int
+    if wlet_mapping:
+        wlet_int = {wl: np.ascontiguousarray(arr, dtype=np.int64)
+                    for wl, arr in wlet_mapping.items()}
 
     for i_frame, frame in enumerate(hbonds):
+        # convert every unique donor/acceptor once, then scatter back
+        flat = frame[:, [0, 2]].ravel()
+        uniq, inv = np.unique(flat, return_inverse=True)
+
         if not wlet_mapping:
-            donors = np.array([convert_hb_atom(x, t, sidechain_ids, water_ids) for x in frame.T[0]])
-            acceptors = np.array([convert_hb_atom(x, t, sidechain_ids, water_ids)
-                                  for x in frame.T[2]])
+            strs = np.array([convert_hb_atom(x, t, cache=cache) for x in uniq])
         else:
-            donors = np.array([convert_hb_atom(x, t, sidechain_ids, water_ids,
-                                               wlet_mapping, i_frame) for x in frame.T[0]])
-            acceptors = np.array([convert_hb_atom(x, t, sidechain_ids, water_ids,
-                                                  wlet_mapping, i_frame) for x in frame.T[2]])
+            # reverse lookup residue index -> letter code for this frame
+            res2letter = {int(wlet_int[wl][i_frame]): wl
+                          for wl in wlet_int if wlet_int[wl][i_frame] != 0}
+            strs = np.array([convert_hb_atom(x, t, res2letter=res2letter,
+                                             i_frame=i_frame, cache=cache) for x in uniq])
+
+        mapped = strs[inv].reshape(-1, 2)
+        donors = mapped[:, 0]
+        acceptors = mapped[:, 1]
 
-        frame_new = np.dstack((donors, acceptors))[0]
+        frame_new = np.column_stack((donors, acceptors))
         hbonds_new.append(frame_new)
 
     return hbonds_new
 
 
-def hbond_matrix(hbond_trjs):
+def hbond_matrix(hbond_trjs, n_workers=None):
     '''
     Extract hbond frequency matrix from list of donor-acceptor arrays for each frame.
 
@@ -176,6 +340,9 @@ def hbond_matrix(hbond_trjs):
     hbond_trjs : list
         Contains lists of np.ndarray for each trj for the hydrogen bonds in each
         frame.
+    n_workers : int or None
+        Number of worker processes that accumulate partial matrices, one per
+        trajectory, e.g. os.cpu_count(). If None or 1, accumulate serially.
 
     Returns
     -------
@@ -190,24 +357,25 @@ def hbond_matrix(hbond_trjs):
     # total number of frames
     n_frames_tot = 0
 
-    # total possible donors/acceptors
-    donors = []
-    acceptors = []
+    # total possible donors/acceptors, as insertion-ordered dicts for O(1) membership
+    donors = {}
+    acceptors = {}
 
     for hbonds in hbond_trjs:
         # add frames of trjs to total number of frames
         n_frames_tot += len(hbonds)
 
-        # add to list of possible donors and acceptors
+        # add to possible donors and acceptors
         for frame in hbonds:
             don_frame = frame[:, 0]
             acc_frame = frame[:, 1]
             for do in don_frame:
-                if do not in donors:
-                    donors.append(do)
+                donors.setdefault(do, len(donors))
             for ac in acc_frame:
-                if ac not in acceptors:
-                    acceptors.append(ac)
+                acceptors.setdefault(ac, len(acceptors))
+
+    donors = list(donors)
+    acceptors = list(acceptors)
 
     # sort donors/acceptors so mutual atoms are sorted before non mutual donors/acceptors
     donors_sorted = []
@@ -230,17 +398,21 @@ def hbond_matrix(hbond_trjs):
     donors = donors_sorted
     acceptors = acceptors_sorted
 
-    # initialize hbond matrix
-    hbond_matrix = np.zeros((len(donors), len(acceptors)))
+    # map donors/acceptors to matrix indices
+    don_idx = {d: i for i, d in enumerate(donors)}
+    acc_idx = {a: i for i, a in enumerate(acceptors)}
 
     # set values of hbnod matrix
-    for hbonds in hbond_trjs:
-        for frame in hbonds:
-            for hb in frame:
-                i_donor = donors.index(hb[0])
-                i_acceptor = acceptors.index(hb[1])
-
-                hbond_matrix[i_donor, i_acceptor] += 1
+    shape = (len(donors), len(acceptors))
+    if n_workers is None or n_workers == 1:
+        hbond_matrix = _partial_hbond_matrix([frame for hbonds in hbond_trjs for frame in hbonds],
+                                             don_idx, acc_idx, shape)
+    else:
+        # trajectories are independent, accumulate partial matrices in parallel
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_partial_hbond_matrix, hbonds, don_idx, acc_idx, shape)
+                       for hbonds in hbond_trjs]
+            hbond_matrix = sum(future.result() for future in futures)
 
     # normalize
     hbond_matrix = hbond_matrix / n_frames_tot
@@ -248,15 +420,59 @@ def hbond_matrix(hbond_trjs):
     return (hbond_matrix, donors, acceptors)
 
 
+def _partial_hbond_matrix(hbonds, don_idx, acc_idx, shape):
+    '''
+    Accumulate hbond counts of a list of frames into a partial matrix.
+
+    Parameters
+    ----------
+    hbonds : list of np.ndarray
+        Hydrogen bonds of each frame.
+    don_idx : dict
+        Maps donors to their matrix row.
+    acc_idx : dict
+        Maps acceptors to their matrix column.
+    shape : tuple
+        Shape of the hbond matrix.
+
+    Returns
+    -------
+    partial : np.ndarray
+        Unnormalized count matrix for the given frames.
+    '''
+    partial = np.zeros(shape)
+    if not hbonds:
+        return partial
+
+    all_hb = np.concatenate(list(hbonds), axis=0)
+
+    # factorize the string columns once and map only the unique values
+    uniq_d, inv_d = np.unique(all_hb[:, 0], return_inverse=True)
+    uniq_a, inv_a = np.unique(all_hb[:, 1], return_inverse=True)
+    rows = np.fromiter((don_idx[x] for x in uniq_d), dtype=np.intp, count=len(uniq_d))
+    cols = np.fromiter((acc_idx[x] for x in uniq_a), dtype=np.intp, count=len(uniq_a))
+
+    _fill_hbond_matrix(partial, rows[inv_d], cols[inv_a])
+    return partial
+
+
+@functools.lru_cache(maxsize=None)
 def _resseq_finder(s):
     '''Get resSeq from donor/acceptor string.'''
-    p = re.search(r'[0-9]+', s)
-    if p:
-        return int(p[0])
-    else:
+    i = 0
+    n = len(s)
+    while i < n and not s[i].isdigit():
+        i += 1
+
+    if i == n:
         # hbond string does not include resseq, i.e. letter code
         # return unicode from string + 10000
-        return ord(s) + 10000
+        return ord(s[0]) + 10000
+
+    j = i
+    while j < n and s[j].isdigit():
+        j += 1
+    return int(s[i:j])
 
 
 def hbond_timeline(hbond_trjs, s):
@@ -270,42 +486,71 @@ def hbond_timeline(hbond_trjs, s):
         frame.
     s : str
         Hbond string of the H-bond participant to be analyzed.
+
+    Returns
+    -------
+    donates_to : dict
+        Maps every acceptor to a sparse timeline, a list of
+        (global_frame, count) tuples holding only the frames with hbonds.
+    accepts_from : dict
+        Maps every donor to a sparse timeline in the same format.
     '''
+    # number of frames of individual trajectories and total number of frames
+    frames = [frame for hbonds in hbond_trjs for frame in hbonds]
+    n_frames_tot = len(frames)
+
+    if not frames:
+        return {}, {}
+
+    # flatten all hbonds and assign a global frame index to each
+    all_hb = np.concatenate(frames, axis=0)
+    global_idx = np.repeat(np.arange(n_frames_tot),
+                           np.fromiter((len(frame) for frame in frames),
+                                       dtype=np.intp, count=n_frames_tot))
+
     # atoms to which participant donantes to (acc.) and accepts from (don.)
-    donates_to = {}
-    accepts_from = {}
+    donates_to = _timeline_counts(all_hb[:, 0] == s, all_hb[:, 1], global_idx, n_frames_tot)
+    accepts_from = _timeline_counts(all_hb[:, 1] == s, all_hb[:, 0], global_idx, n_frames_tot)
 
-    # number of frames of individual trajectories and total number of frames
-    n_frames_tot = 0
-    n_frames = np.zeros(len(hbond_trjs))
-    for i_trj, hbonds in enumerate(hbond_trjs):
-        n_frames_tot += len(hbonds)
-        n_frames[i_trj] = len(hbonds)
+    return donates_to, accepts_from
 
-    for i_trj, hbonds in enumerate(hbond_trjs):
-        for i_frame, frame in enumerate(hbonds):
 
-            # get hbonds in which s donates to other atoms
-            mask_don_to = np.zeros(frame.shape, bool) | (frame[:, 0] == s)[:, None]
-            don_to_frame = frame[mask_don_to].reshape(-1, 2)
+def _timeline_counts(sel, partners, global_idx, n_frames_tot):
+    '''
+    Count hbonds per partner and frame for the selected hbonds.
+
+    Parameters
+    ----------
+    sel : np.ndarray
+        Boolean mask selecting the hbonds in which the analyzed participant
+        takes part.
+    partners : np.ndarray
+        Partner (donor or acceptor) strings for all hbonds.
+    global_idx : np.ndarray
+        Global frame index for all hbonds.
+    n_frames_tot : int
+        Total number of frames.
 
-            # extract acceptors
-            for ac in don_to_frame[:, 1]:
-                if ac not in donates_to:
-                    donates_to[ac] = np.zeros(n_frames_tot, dtype=int)
-                donates_to[ac][int(n_frames[:i_trj].sum() + i_frame)] += 1
+    Returns
+    -------
+    timeline : dict
+        Maps each partner to a list of (frame, count) tuples holding only the
+        frames with at least one hbond, sorted by frame. Keys are ordered by
+        first occurrence.
+    '''
+    partners = partners[sel]
+    uniq, first, inv = np.unique(partners, return_index=True, return_inverse=True)
 
-            # get hbonds in which s accepts from other atoms
-            mask_acc_from = np.zeros(frame.shape, bool) | (frame[:, 1] == s)[:, None]
-            acc_from_frame = frame[mask_acc_from].reshape(-1, 2)
+    # count duplicate (partner, frame) pairs, store only the nonzero entries
+    pairs = inv.astype(np.int64) * n_frames_tot + global_idx[sel]
+    uniq_pairs, pair_counts = np.unique(pairs, return_counts=True)
 
-            # extract donors
-            for do in acc_from_frame[:, 0]:
-                if do not in accepts_from:
-                    accepts_from[do] = np.zeros(n_frames_tot, dtype=int)
-                accepts_from[do][int(n_frames[:i_trj].sum() + i_frame)] += 1
+    # keep first-occurrence order of partners
+    timeline = {uniq[i]: [] for i in np.argsort(first)}
+    for pair, count in zip(uniq_pairs, pair_counts):
+        timeline[uniq[pair // n_frames_tot]].append((int(pair % n_frames_tot), int(count)))
 
-    return donates_to, accepts_from
+    return timeline
 
 
 def hbond_most_frequent(hbond_trjs, s):
@@ -332,25 +577,41 @@ def hbond_most_frequent(hbond_trjs, s):
     donates_to, accepts_from = hbond_timeline(hbond_trjs, s)
 
     # total number of frames
-    n_frames_tot = len(list(donates_to.values())[0])
+    n_frames_tot = sum(len(hbonds) for hbonds in hbond_trjs)
 
-    # most common donors and acceptors
-    donors_frequency = {}
-    acceptors_frequency = {}
+    # most common donors and acceptors, sorted by highest frequency
+    donors_frequency = _nonzero_frequencies(accepts_from, n_frames_tot)
+    acceptors_frequency = _nonzero_frequencies(donates_to, n_frames_tot)
 
-    # calculate frequencies
-    for do in accepts_from:
-        donors_frequency[do] = np.count_nonzero(accepts_from[do]) / n_frames_tot
-    for ac in donates_to:
-        acceptors_frequency[ac] = np.count_nonzero(donates_to[ac]) / n_frames_tot
+    return donors_frequency, acceptors_frequency
 
-    # sort by highest frequency
-    donors_frequency = {k: v for k, v in sorted(
-        donors_frequency.items(), key=lambda item: item[1], reverse=True)}
-    acceptors_frequency = {k: v for k, v in sorted(
-        acceptors_frequency.items(), key=lambda item: item[1], reverse=True)}
 
-    return donors_frequency, acceptors_frequency
+def _nonzero_frequencies(timeline, n_frames_tot):
+    '''
+    Calculate frequency of nonzero frames per timeline key, sorted descending.
+
+    Parameters
+    ----------
+    timeline : dict
+        Maps participants to sparse (frame, count) timelines as returned by
+        hbond_timeline.
+    n_frames_tot : int
+        Total number of frames.
+
+    Returns
+    -------
+    frequencies : dict
+        Maps participants to their frequency, highest first.
+    '''
+    names = list(timeline)
+    if not names:
+        return {}
+
+    # the number of frames with hbonds is the number of stored entries
+    freqs = np.array([len(timeline[k]) for k in names]) / n_frames_tot
+
+    order = np.argsort(-freqs, kind='stable')
+    return {names[i]: freqs[i] for i in order}
 
 
 def plot_frequency(ax, frequency, s, n=6, donors=True):
@@ -370,16 +631,16 @@ def plot_frequency(ax, frequency, s, n=6, donors=True):
     donors : bool
         Whether to plot donors or acceptors. Color donors blue, acceptors red.
     '''
-    x = list(frequency.keys())[:n]
-    y = np.array([frequency[x] for x in x]) * 100  # percentage
+    keys = list(islice(frequency, n))
+    y = np.fromiter((frequency[k] for k in keys), dtype=np.float64, count=len(keys)) * 100  # percentage
 
     if donors:
-        ax.bar(range(len(x)), y, color='darkblue')
-        ax.set_xticklabels(x, rotation=90)
+        ax.bar(range(len(keys)), y, color='darkblue')
+        ax.set_xticklabels(keys, rotation=90)
         ax.set_xlabel('Donors', weight='bold')
     else:
-        ax.bar(range(len(x)), y, color='darkred')
-        ax.set_xticklabels(x, rotation=90)
+        ax.bar(range(len(keys)), y, color='darkred')
+        ax.set_xticklabels(keys, rotation=90)
         ax.set_xlabel('Acceptors', weight='bold')
 
     ax.set_xticks(range(n))
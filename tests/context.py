@@ -2,4 +2,5 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-import track_s1_water
\ No newline at end of file
+import track_s1_water
+import hbonds
\ No newline at end of file
@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+import mdtraj as md
+from context import hbonds
+
+
+def _map_letter_impls():
+    '''Collect available _map_letter implementations (numpy and numba).'''
+    impls = [hbonds._map_letter_numpy]
+    if hbonds._map_letter is not hbonds._map_letter_numpy:
+        impls.append(hbonds._map_letter)
+    return impls
+
+
+@pytest.mark.parametrize('map_letter', _map_letter_impls())
+def test_map_letter_duplicate(map_letter):
+    '''Test that _map_letter reports duplicated residue indices in a frame.'''
+    wrid_letter = np.array([280, 281], dtype=np.int64)
+    wrid_red = np.array([5, 6, 7], dtype=np.int64)
+
+    # frame 0 contains the tracked residue index 280 twice
+    wrid_whole = np.array([[280, 280, 281],
+                           [280, 281, 282]], dtype=np.int64)
+
+    out, dup = map_letter(wrid_letter, wrid_whole, wrid_red)
+    assert dup == 0
+
+    # without duplicates no frame is flagged and the mapping is returned
+    wrid_whole = np.array([[280, 283, 281],
+                           [280, 281, 282]], dtype=np.int64)
+
+    out, dup = map_letter(wrid_letter, wrid_whole, wrid_red)
+    assert dup == -1
+    assert (out == np.array([5, 6])).all()
+
+
+@pytest.mark.filterwarnings('ignore:.*file contains topology information.*')
+def test_map_w_to_index_duplicate(tmp_path):
+    '''Test that map_w_to_index raises on duplicated residue indices.'''
+    t = md.load('data/4y0z_a.pdb')
+    water_o = t.top.select('is_water and element == O')
+    atom_mapping = {'A': np.full(t.n_frames, water_o[0], dtype=float)}
+
+    # idx file where frame 0 contains the tracked residue index twice
+    wres = np.array([t.top.atom(a).residue.index for a in water_o])
+    wrid_whole = np.tile(wres, (t.n_frames, 1))
+    wrid_whole[0, 1] = wrid_whole[0, 0]
+
+    idx_file = tmp_path / 'idx_file.txt'
+    np.savetxt(idx_file, wrid_whole, fmt='%d')
+
+    with pytest.raises(ValueError, match='More than one index'):
+        hbonds.map_w_to_index(t, t, str(idx_file), atom_mapping)